@@ -1,19 +1,79 @@
 #!/usr/bin/env python3
 import subprocess
 import os
+import re
+import sys
 import json
+import math
 import shutil
 import time
+import glob
+from collections import deque
+
+# orjson is optional: faster decode, falls back to the stdlib json module
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        # Same 2-space layout as orjson, so the file doesn't churn between setups
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+# pycups is optional: asks the CUPS daemon over its socket instead of forking lpstat
+try:
+    import cups
+except ImportError:
+    cups = None
+
+# Pre-validated numeric input, so bad keystrokes don't go through int()/float() exceptions
+_NUMBER_RES = {
+    int: re.compile(r'[-+]?\d+'),
+    float: re.compile(r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)'),
+}
 
 class ZebraPrinterManager:
+    __slots__ = (
+        'settings', 'usb_online', 'printer_verified',
+        '_bin', '_saved_settings', '_dots_cache', '_zpl_template',
+        '_hw_cache_ts', '_dirty', '_lp_jobs', '_cups_conn',
+    )
+
     CONFIG_FILE = "config.json"
     DOTS_PER_MM = 8  # 203 DPI approximation
+    ZEBRA_VENDOR_ID = "0a5f"
+    SYSFS_USB_DIR = "/sys/bus/usb/devices"
+    HW_CACHE_TTL = 5.0  # seconds
+    MAX_PENDING_JOBS = 8  # lp submissions allowed in flight before we block
+    LP_GRACE_SECONDS = 0.5  # How long print_label waits for lp before reporting QUEUED
+
+    ANSI_CLEAR = '\x1b[2J\x1b[H'  # Clear + cursor home, avoids spawning 'clear'
+
+    # Settings table layout
+    _COL_W1, _COL_W2, _COL_W3 = 18, 22, 30
+    _SEP_TOP = f" ┌─{'─'*_COL_W1}─┬─{'─'*_COL_W2}─┬─{'─'*_COL_W3}─┐"
+    _SEP_BOT = f" └─{'─'*_COL_W1}─┴─{'─'*_COL_W2}─┴─{'─'*_COL_W3}─┘"
+    _ROW_FMT = f" │ {{:<{_COL_W1}}} │ {{:<{_COL_W2}}} │ {{:<{_COL_W3}}} │"
 
     def __init__(self):
+        # Resolve tool paths once; installed binaries don't change at runtime
+        self._bin = {name: shutil.which(name) for name in ('lsusb', 'lpstat', 'lp', 'cancel')}
         self.settings = self.load_settings()
+        self._dots_cache = {}
+        self._zpl_template = b""
+        self._settings_changed()
         self.usb_online = False
         self.printer_verified = False
-        self.check_hardware_connection()
+        self._hw_cache_ts = 0.0
+        self._dirty = True  # Menu needs a repaint
+        self._lp_jobs = deque()  # In-flight (lp process, printer name), oldest first
+        self._cups_conn = None  # Lazily opened pycups connection
+        self.check_hardware_connection(force=True)
 
     def load_settings(self):
         default_settings = {
@@ -30,58 +90,135 @@ class ZebraPrinterManager:
             "offset_y_mm": 2.0,       # Top margin
             "print_method": "direct_thermal"
         }
+        settings = default_settings
+        loaded_ok = False
         if os.path.exists(self.CONFIG_FILE):
             try:
-                with open(self.CONFIG_FILE, 'r') as f:
-                    loaded = json.load(f)
+                with open(self.CONFIG_FILE, 'rb') as f:
+                    loaded = _json_loads(f.read())
                     
-                    return {**default_settings, **loaded}
+                    settings = {**default_settings, **loaded}
+                    loaded_ok = True
             except json.JSONDecodeError:
                 print("Error loading config.json, using defaults.")
-                return default_settings
-        return default_settings
+
+        # Coerce numeric fields once so mm_to_dots and ZPL rendering can skip validation
+        for key, default in default_settings.items():
+            if isinstance(default, (int, float)):
+                try:
+                    value = type(default)(settings[key])
+                    if not math.isfinite(value):
+                        raise ValueError(key)
+                    settings[key] = value
+                except (TypeError, ValueError, OverflowError):
+                    print(f"Invalid value for '{key}' in config.json, using default.")
+                    settings[key] = default_settings[key]
+
+        # Snapshot of what's on disk, used to skip rewriting an unchanged config
+        self._saved_settings = dict(settings) if loaded_ok else None
+        return settings
 
     def save_settings(self):
+        if self.settings == self._saved_settings:
+            print("Settings unchanged.")
+            return
         try:
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(self.settings, f, indent=4)
+            with open(self.CONFIG_FILE, 'wb') as f:
+                f.write(_json_dumps(self.settings))
+            self._saved_settings = dict(self.settings)
             print("Settings saved to config.json.")
         except IOError as e:
             print(f"Error saving settings: {e}")
 
     def mm_to_dots(self, mm):
         """Converts millimeters to dots."""
-        try:
-            return int(float(mm) * self.DOTS_PER_MM)
-        except ValueError:
-            return 0
+        return int(mm * self.DOTS_PER_MM)
 
-    def check_hardware_connection(self):
+    def _recompute_dots(self):
+        """Converts all mm settings to dots once."""
+        s = self.settings
+        self._dots_cache = {
+            'width_dots': self.mm_to_dots(s['label_width_mm']),
+            'height_dots': self.mm_to_dots(s['label_height_mm']),
+            'offset_x_dots': self.mm_to_dots(s['offset_x_mm']),
+            'offset_y_dots': self.mm_to_dots(s['offset_y_mm']),
+            'font_h_dots': self.mm_to_dots(s['font_h_mm']),
+            'font_w_dots': self.mm_to_dots(s['font_w_mm']),
+            'border_dots': self.mm_to_dots(1),
+        }
+
+    def check_hardware_connection(self, force=False):
         """Checks if a Zebra device is physically connected via USB."""
+        # Cached for a few seconds so menu repaints don't re-run lsusb/lpstat
+        if not force and time.monotonic() - self._hw_cache_ts < self.HW_CACHE_TTL:
+            return
+        self._hw_cache_ts = time.monotonic()
         self.usb_online = False
-        if not shutil.which('lsusb'):
+        use_sysfs = os.path.isdir(self.SYSFS_USB_DIR)
+        if not use_sysfs and self._bin['lsusb'] is None:
             self.usb_online = True # Assume true to avoid blocking
             return
 
-        try:
-            result = subprocess.run(['lsusb'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            if "Zebra" in result.stdout or "0a5f:" in result.stdout:
-                self.usb_online = True
-            else:
+        # Start lpstat first so it runs while we probe USB (not needed with pycups)
+        lpstat_proc = self.start_lpstat() if cups is None else None
+
+        if use_sysfs:
+            # Linux: read vendor IDs straight from sysfs, no lsusb process needed
+            self.usb_online = self.scan_sysfs_usb()
+        else:
+            try:
+                # Match on raw bytes, no need to decode the whole listing
+                lsusb_proc = subprocess.Popen([self._bin['lsusb']], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+                stdout, _ = lsusb_proc.communicate()
+                if b"Zebra" in stdout or f"{self.ZEBRA_VENDOR_ID}:".encode() in stdout:
+                    self.usb_online = True
+                else:
+                    self.usb_online = False
+            except Exception:
                 self.usb_online = False
+        self.check_cups_status(lpstat_proc)
+
+    def scan_sysfs_usb(self):
+        """Returns True if any USB device in sysfs has the Zebra vendor ID."""
+        for path in glob.glob(os.path.join(self.SYSFS_USB_DIR, '*', 'idVendor')):
+            try:
+                with open(path, 'r') as f:
+                    if f.read().strip() == self.ZEBRA_VENDOR_ID:
+                        return True
+            except OSError:
+                continue
+        return False
+
+    def start_lpstat(self):
+        """Launches 'lpstat -p' without waiting. Returns None if unavailable."""
+        if self._bin['lpstat'] is None:
+            return None
+        try:
+            return subprocess.Popen([self._bin['lpstat'], '-p'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         except Exception:
-            self.usb_online = False
-        self.check_cups_status()
+            return None
 
-    def check_cups_status(self):
+    def check_cups_status(self, lpstat_proc=None):
         printer = self.settings['printer_name']
-        if not shutil.which('lpstat'):
+        if cups is not None:
+            try:
+                if self._cups_conn is None:
+                    self._cups_conn = cups.Connection()
+                self.printer_verified = printer in self._cups_conn.getPrinters()
+            except Exception:
+                self._cups_conn = None  # Reconnect on the next check
+                self.printer_verified = False
+            return
+
+        if lpstat_proc is None:
+            lpstat_proc = self.start_lpstat()
+        if lpstat_proc is None:
             self.printer_verified = False
             return
 
         try:
-            result = subprocess.run(['lpstat', '-p'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            if printer in result.stdout:
+            stdout, _ = lpstat_proc.communicate()
+            if printer.encode() in stdout:
                 self.printer_verified = True
             else:
                 self.printer_verified = False
@@ -89,28 +226,47 @@ class ZebraPrinterManager:
             self.printer_verified = False
 
     def clear_screen(self):
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # POSIX terminals are cleared with ANSI_CLEAR inside print_menu's buffer
+        os.system('cls')
 
     def get_input(self, prompt, cast_type=str, valid_range=None, default=None):
         while True:
             user_input = input(prompt)
             if not user_input and default is not None:
                 return default
-            try:
-                value = cast_type(user_input)
-                if valid_range and value not in valid_range:
+            pattern = _NUMBER_RES.get(cast_type)
+            if pattern is not None:
+                # A full match guarantees int()/float() succeeds
+                valid = pattern.fullmatch(user_input.strip()) is not None
+                value = cast_type(user_input) if valid else None
+            else:
+                try:
+                    value = cast_type(user_input)
+                    valid = True
+                except ValueError:
+                    valid = False
+            if not valid:
+                print(f"Invalid input. Please enter a valid {cast_type.__name__}.")
+                continue
+            if valid_range:
+                if isinstance(valid_range, range) and valid_range.step == 1:
+                    in_range = valid_range.start <= value < valid_range.stop
+                else:
+                    in_range = value in valid_range
+                if not in_range:
                     print(f"Value must be between {min(valid_range)} and {max(valid_range)}.")
                     continue
-                return value
-            except ValueError:
-                print(f"Invalid input. Please enter a valid {cast_type.__name__}.")
+            return value
 
     def clear_print_queue(self):
         printer = self.settings['printer_name']
         print(f"\n🗑️  Clearing print queue for '{printer}'...")
         try:
-            subprocess.run(['cancel', '-a', printer], check=False)
-            print("✅ Queue cleared.")
+            result = subprocess.run([self._bin['cancel'] or 'cancel', '-a', printer], check=False)
+            if result.returncode == 0:
+                print("✅ Queue cleared.")
+            else:
+                print(f"❌ Failed to clear queue (cancel exited with {result.returncode}).")
         except FileNotFoundError:
             print("❌ Error: 'cancel' command not found.")
         input("Press Enter to continue...")
@@ -143,67 +299,106 @@ class ZebraPrinterManager:
         
         input("Fonts updated. Press Enter...")
 
-    def generate_zpl(self, test_pattern=False):
+    def _zpl_body(self, test_pattern, text):
+        """Renders the label ZPL up to (not including) ^PQ/^XZ."""
         s = self.settings
-        width_dots = self.mm_to_dots(s['label_width_mm'])
-        height_dots = self.mm_to_dots(s['label_height_mm'])
-        offset_x_dots = self.mm_to_dots(s['offset_x_mm'])
-        offset_y_dots = self.mm_to_dots(s['offset_y_mm'])
-        
-        # Font Calculations
-        font_h_dots = self.mm_to_dots(s['font_h_mm'])
-        font_w_dots = self.mm_to_dots(s['font_w_mm'])
-        
-        zpl = [
-            f"~SD{s['darkness']}",
-            "^XA",
-            "^MTD",             # Force Direct Thermal
-            f"^PR{s['speed']}",
-            f"^MD{s['media_darkness']}",
-            f"^PW{width_dots}",
-            f"^LL{height_dots}",
-            "^CI28"
-        ]
+        d = self._dots_cache
+        width_dots = d['width_dots']
+        height_dots = d['height_dots']
+
+        # Build the job straight into a byte buffer, ready for lp's stdin
+        zpl = bytearray(b"~SD%d" % s['darkness'])
+        zpl += b"\n^XA"
+        zpl += b"\n^MTD"             # Force Direct Thermal
+        zpl += b"\n^PR%d" % s['speed']
+        zpl += b"\n^MD%d" % s['media_darkness']
+        zpl += b"\n^PW%d" % width_dots
+        zpl += b"\n^LL%d" % height_dots
+        zpl += b"\n^CI28"
 
         if test_pattern:
             # 1mm thick black border = ~8 dots
-            border_thickness = self.mm_to_dots(1) 
-            zpl.append(f"^FO0,0^GB{width_dots},{height_dots},{border_thickness},B,0^FS")
+            zpl += b"\n^FO0,0^GB%d,%d,%d,B,0^FS" % (width_dots, height_dots, d['border_dots'])
             # Text inside
-            zpl.append(f"^FO{width_dots//4},{height_dots//3}^A0N,30,30^FDTEST FRAME^FS")
+            zpl += b"\n^FO%d,%d^A0N,30,30^FDTEST FRAME^FS" % (width_dots//4, height_dots//3)
         else:
-            zpl.append(f"^FO{offset_x_dots},{offset_y_dots}")
+            zpl += b"\n^FO%d,%d" % (d['offset_x_dots'], d['offset_y_dots'])
             # Use Zebra Font 0 (^A0)
-            zpl.append(f"^A0N,{font_h_dots},{font_w_dots}")
-            zpl.append(f"^FD{s['text']}^FS")
+            zpl += b"\n^A0N,%d,%d" % (d['font_h_dots'], d['font_w_dots'])
+            zpl += b"\n^FD" + text + b"^FS"
+        return bytes(zpl)
 
-        zpl.append("^XZ")
-        return "\n".join(zpl)
+    def _build_zpl_template(self):
+        """Pre-renders the label for the current settings; only the text varies per print."""
+        self._zpl_template = self._zpl_body(False, b"{text}")
+
+    def _settings_changed(self):
+        """Refreshes cached dots and ZPL; call after editing any print setting."""
+        self._recompute_dots()
+        self._build_zpl_template()
+
+    def generate_zpl(self, test_pattern=False, copies=1):
+        if test_pattern:
+            zpl = self._zpl_body(True, None)
+        else:
+            zpl = self._zpl_template.replace(b"{text}", str(self.settings['text']).encode())
 
-    def print_label(self, test_pattern=False):
-        # 1. Hardware Check
-        self.check_hardware_connection()
+        if copies > 1:
+            # Let the printer repeat the label instead of spooling one job per copy
+            zpl += b"\n^PQ%d" % copies
+
+        return zpl + b"\n^XZ"
+
+    def print_label(self, test_pattern=False, copies=1):
+        # 1. Hardware Check (always fresh before printing)
+        self.check_hardware_connection(force=True)
         if not self.usb_online:
             print("\n❌ CRITICAL HARDWARE ERROR: Printer not detected on USB!")
             print("   Please check the USB cable connectivity.")
             input("\nPress Enter to return to menu...")
             return
 
-        zpl = self.generate_zpl(test_pattern)
+        zpl = self.generate_zpl(test_pattern, copies)
         printer_name = self.settings['printer_name']
         
-        print(f"\nSending job to '{printer_name}'...")
+        print(f"\nSending job to '{printer_name}' ({copies} label(s))...")
         
         try:
-            cmd = ['lp', '-d', printer_name, '-o', 'raw', '-']
-            process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            stdout, stderr = process.communicate(input=zpl)
-            
-            if process.returncode == 0:
-                print("✅ SENT: Print job submitted successfully.")
+            # Wait for the oldest submission if too many are still in flight
+            if len(self._lp_jobs) >= self.MAX_PENDING_JOBS:
+                self.reap_print_jobs(wait_oldest=True)
+
+            cmd = [self._bin['lp'] or 'lp', '-d', printer_name, '-o', 'raw', '-']
+            process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            self._lp_jobs.append((process, printer_name))
+            # A label is far smaller than the pipe buffer, so this never blocks
+            try:
+                process.stdin.write(zpl)
+                process.stdin.close()
+            except BrokenPipeError:
+                # lp exited without reading (e.g. unknown printer); its
+                # exit code and stderr are reported below or when reaped
+                pass
+
+            # lp usually returns within a few ms: give it a short grace period so the
+            # result shows next to the job, without stalling on a slow spooler
+            try:
+                process.wait(timeout=self.LP_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                pass
+            if process.returncode is None:
+                print("📤 QUEUED: Print job handed to CUPS.")
             else:
-                print("❌ FAILED: The print system returned an error.")
-                print(f"    Error Details: {stderr.strip()}")
+                self._lp_jobs.remove((process, printer_name))
+                error = self.collect_print_job(process)
+                if process.returncode == 0:
+                    print("✅ SENT: Print job submitted successfully.")
+                else:
+                    print("❌ FAILED: The print system returned an error.")
+                    print(f"    Error Details: {error}")
+
+            # Earlier queued jobs may have failed in the meantime
+            self.reap_print_jobs()
         except FileNotFoundError:
             print("❌ SYSTEM ERROR: 'lp' command not found. Install CUPS.")
         except Exception as e:
@@ -211,67 +406,123 @@ class ZebraPrinterManager:
         
         input("\n[Press Enter to continue]")
 
-    def print_header(self):
-        self.clear_screen()
-        print("╔══════════════════════════════════════════════════════════════╗")
-        print("║                   ZEBRA GK420t CLI MANAGER                   ║")
-        print("╚══════════════════════════════════════════════════════════════╝")
-        
-        # Status Bar
+    def collect_print_job(self, process):
+        """Reads and closes a finished lp job's stderr, returning it as text."""
+        stderr = process.stderr.read()
+        process.stderr.close()
+        return stderr.decode(errors='replace').strip()
+
+    def reap_print_jobs(self, wait_oldest=False, wait_all=False):
+        """Collects finished queued lp jobs and reports any that failed."""
+        if wait_all:
+            for process, _ in self._lp_jobs:
+                process.wait()
+        elif wait_oldest and self._lp_jobs:
+            self._lp_jobs[0][0].wait()
+
+        failed = False
+        pending = deque()
+        for job in self._lp_jobs:
+            process, printer_name = job
+            if process.poll() is None:
+                pending.append(job)
+                continue
+            error = self.collect_print_job(process)
+            if process.returncode != 0:
+                failed = True
+                print(f"\n❌ FAILED: Earlier job to '{printer_name}' returned an error.")
+                print(f"    Error Details: {error}")
+        self._lp_jobs = pending
+        return failed
+
+    def header_lines(self):
         usb_status = "🔌 USB: CONNECTED" if self.usb_online else "🔌 USB: DISCONNECTED"
         p_status = "🖨️  CUPS: ONLINE" if self.printer_verified else "🖨️  CUPS: NOT FOUND"
-        
-        print(f" PRINTER: {self.settings['printer_name']:<18} | {usb_status} | {p_status}")
-        print("────────────────────────────────────────────────────────────────")
+        return [
+            "╔══════════════════════════════════════════════════════════════╗",
+            "║                   ZEBRA GK420t CLI MANAGER                   ║",
+            "╚══════════════════════════════════════════════════════════════╝",
+            # Status Bar
+            f" PRINTER: {self.settings['printer_name']:<18} | {usb_status} | {p_status}",
+            "────────────────────────────────────────────────────────────────",
+        ]
+
+    def print_menu(self):
+        s = self.settings
+
+        # Table formatting
+        w3 = self._COL_W3
+        r1c1 = f"W: {s['label_width_mm']} mm"
+        r1c2 = f"Speed: {s['speed']} ips"
+        r1c3 = f"Text: {s['text']}"
+        if len(r1c3) > w3: r1c3 = r1c3[:w3-3] + "..."
+
+        r2c1 = f"H: {s['label_height_mm']} mm"
+        r2c2 = f"Dark:  {s['darkness']} (~SD)"
+        # Update Font Display to MM
+        r2c3 = f"Font: Zebra 0 ({s['font_h_mm']}x{s['font_w_mm']}mm)"
+
+        r3c1 = ""
+        r3c2 = f"M-Dark:{s['media_darkness']} (^MD)"
+        r3c3 = f"Off: X={s['offset_x_mm']} Y={s['offset_y_mm']}"
+
+        # Build the whole screen and emit it with a single write
+        lines = self.header_lines()
+        lines += [
+            " CURRENT SETTINGS:",
+            self._SEP_TOP,
+            self._ROW_FMT.format(r1c1, r1c2, r1c3),
+            self._ROW_FMT.format(r2c1, r2c2, r2c3),
+            self._ROW_FMT.format(r3c1, r3c2, r3c3),
+            self._SEP_BOT,
+            "\n ACTIONS:",
+            "  1. 🖨️  PRINT LABEL",
+            "  2. 🛠️  PRINT TEST FRAME (Check Margins)",
+            "\n CONFIGURATION:",
+            "  3. 📝 Set Text",
+            "  4. 📏​ Set Dimensions (mm)",
+            "  5. 📍 Set Offsets (Fix Fading)",
+            "  6. ⚙️  Calibrate (Darkness & Speed)",
+            "  7. 🔠 Font Settings (Size in mm)",
+            "  8. 🔁 Change Printer Name",
+            "  9. 🗑️  Clear Print Queue",
+            "\n  0. 💾 Save & Exit",
+        ]
+        if os.name == 'posix':
+            screen = self.ANSI_CLEAR
+        else:
+            self.clear_screen()
+            screen = ""
+        sys.stdout.write(screen + "\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def main_menu(self):
         while True:
+            # Report print jobs that failed since the last loop
+            if self._lp_jobs and self.reap_print_jobs():
+                input(" Press Enter...")
+                self._dirty = True
+
             # Refresh connectivity occasionally
+            status = (self.usb_online, self.printer_verified)
             self.check_hardware_connection()
-            
-            self.print_header()
+            if (self.usb_online, self.printer_verified) != status:
+                self._dirty = True
+
             s = self.settings
-            
-            # Table formatting
-            w1, w2, w3 = 18, 22, 30
-            r1c1 = f"W: {s['label_width_mm']} mm"
-            r1c2 = f"Speed: {s['speed']} ips"
-            r1c3 = f"Text: {s['text']}"
-            if len(r1c3) > w3: r1c3 = r1c3[:w3-3] + "..."
-
-            r2c1 = f"H: {s['label_height_mm']} mm"
-            r2c2 = f"Dark:  {s['darkness']} (~SD)"
-            # Update Font Display to MM
-            r2c3 = f"Font: Zebra 0 ({s['font_h_mm']}x{s['font_w_mm']}mm)"
-
-            r3c1 = ""
-            r3c2 = f"M-Dark:{s['media_darkness']} (^MD)"
-            r3c3 = f"Off: X={s['offset_x_mm']} Y={s['offset_y_mm']}"
-
-            print(" CURRENT SETTINGS:")
-            print(f" ┌─{'─'*w1}─┬─{'─'*w2}─┬─{'─'*w3}─┐")
-            print(f" │ {r1c1:<{w1}} │ {r1c2:<{w2}} │ {r1c3:<{w3}} │")
-            print(f" │ {r2c1:<{w1}} │ {r2c2:<{w2}} │ {r2c3:<{w3}} │")
-            print(f" │ {r3c1:<{w1}} │ {r3c2:<{w2}} │ {r3c3:<{w3}} │")
-            print(f" └─{'─'*w1}─┴─{'─'*w2}─┴─{'─'*w3}─┘")
-            
-            print("\n ACTIONS:")
-            print("  1. 🖨️  PRINT LABEL")
-            print("  2. 🛠️  PRINT TEST FRAME (Check Margins)")
-            print("\n CONFIGURATION:")
-            print("  3. 📝 Set Text")
-            print("  4. 📏​ Set Dimensions (mm)")
-            print("  5. 📍 Set Offsets (Fix Fading)")
-            print("  6. ⚙️  Calibrate (Darkness & Speed)")
-            print("  7. 🔠 Font Settings (Size in mm)")
-            print("  8. 🔁 Change Printer Name")
-            print("  9. 🗑️  Clear Print Queue")
-            print("\n  0. 💾 Save & Exit")
-            
+            if self._dirty:
+                self.print_menu()
+                self._dirty = False
+
             choice = input("\n ➤ Select Option: ")
+            if not choice:
+                continue
+            # Every option below edits settings or prints over the menu
+            self._dirty = True
 
             if choice == "1":
-                self.print_label(False)
+                copies = self.get_input(" Copies [1]: ", int, range(1, 1000), default=1)
+                self.print_label(False, copies)
             elif choice == "2":
                 self.print_label(True)
             elif choice == "3":
@@ -281,12 +532,14 @@ class ZebraPrinterManager:
                 print(" ℹ️  Measure your label with a ruler. Exact dimensions prevent skipping.")
                 s['label_width_mm'] = self.get_input(" Width (mm): ", float)
                 s['label_height_mm'] = self.get_input(" Height (mm): ", float)
+                self._settings_changed()
             elif choice == "5":
                 print("\n --- PRINT OFFSETS (mm) ---")
                 print(" ℹ️  X Offset: Shifts print right. Use 1-2mm if left side is fading (cold start).")
                 print(" ℹ️  Y Offset: Shifts print down. Use if top is cut off.")
                 s['offset_x_mm'] = self.get_input(" Left X Offset (mm): ", float)
                 s['offset_y_mm'] = self.get_input(" Top Y Offset (mm): ", float)
+                self._settings_changed()
             elif choice == "6":
                 print("\n --- MECHANICS & THERMAL ---")
                 print(" ℹ️  Darkness (~SD 0-30): Higher = Darker. Too high = Head wear & smudging.")
@@ -295,14 +548,18 @@ class ZebraPrinterManager:
                 s['darkness'] = self.get_input(" Darkness (~SD 0-30): ", int, range(0, 31))
                 s['media_darkness'] = self.get_input(" Media Darkness (^MD -30 to 30): ", int, range(-30, 31))
                 s['speed'] = self.get_input(" Speed (2-5 ips): ", int, range(2, 7))
+                self._settings_changed()
             elif choice == "7":
                 self.configure_fonts()
+                self._settings_changed()
             elif choice == "8":
                 s['printer_name'] = input(" Enter CUPS Printer Name: ")
                 self.check_cups_status()
             elif choice == "9":
                 self.clear_print_queue()
             elif choice == "0":
+                if self.reap_print_jobs(wait_all=True):
+                    input(" Press Enter...")
                 self.save_settings()
                 print(" Goodbye!")
                 break